@@ -123,6 +123,7 @@ class Drawing(ExtraModel, metaclass=AnnotationFreeMeta):
     # subsess: Subsession = models.Link(Subsession)
     participant: Participant = models.Link(Participant)
     svg: str = models.LongStringField(initial="")  # type: ignore
+    seq: int = models.IntegerField(initial=0)  # type: ignore
     drawing_time: float = models.FloatField(initial=0.0)  # type: ignore
     start_timestamp: float = models.FloatField(initial=0.0)  # type: ignore
     end_timestamp: float = models.FloatField(initial=0.0)  # type: ignore
@@ -266,6 +267,17 @@ class ScreenInfoMixin:
 def complexity_requirement_met(svg: str, drawing_time: float) -> bool:
     return len(svg) > C.MIN_DRAWING_LENGTH and drawing_time > C.MIN_DRAWING_TIME
 
+def apply_drawing_update(drawing: Drawing, data: dict[str, Any]) -> None:
+    """Stores the submitted svg unless the server already has a newer state,
+    so retransmitted or out-of-order updates from the draft journal are ignored.
+    """
+    if "seq" in data:
+        seq = int(data["seq"])
+        if seq <= drawing.seq:
+            return
+        drawing.seq = seq
+    drawing.svg = base64.b64decode(data["drawing"]).decode('utf-8')
+
 
 # PAGES
 class Welcome(Page):
@@ -390,11 +402,12 @@ class Draw(ScreenInfoMixin, Page):
                             drawing=base64.b64encode(drawing.svg.encode('utf-8')).decode('utf-8'),
                             completed=drawing.completed,
                             complexity_met=complexity_requirement_met(drawing.svg, drawing.drawing_time),
+                            seq=drawing.seq,
                         )
                     }
             elif data["event"] == "update":
                 print("updating drawing for ", player.id_in_group)
-                drawing.svg = base64.b64decode(data["drawing"]).decode('utf-8')
+                apply_drawing_update(drawing, data)
                 # update drawing time
                 drawing.drawing_time = datetime.datetime.now().timestamp() - drawing.start_timestamp
                 # let the client know if the complexity requirement is met
@@ -403,6 +416,7 @@ class Draw(ScreenInfoMixin, Page):
                         event='update_complexity',
                         time_left=C.DRAWING_TIME - drawing.drawing_time,
                         complexity_met=complexity_requirement_met(drawing.svg, drawing.drawing_time),
+                        seq=drawing.seq,
                     )
                 }
             elif data["event"] == "complexity_check":
@@ -414,11 +428,12 @@ class Draw(ScreenInfoMixin, Page):
                         event='update_complexity',
                         time_left=C.DRAWING_TIME - drawing.drawing_time,
                         complexity_met=complexity_requirement_met(drawing.svg, drawing.drawing_time),
+                        seq=drawing.seq,
                     )
                 }
             elif data["event"] == "drawing_complete":
                 drawing.end_timestamp = datetime.datetime.now().timestamp()
-                drawing.svg = base64.b64decode(data["drawing"]).decode('utf-8')
+                apply_drawing_update(drawing, data)
                 drawing.drawing_time = drawing.end_timestamp - drawing.start_timestamp
                 drawing.completed = True
                 # send confirmation to the client
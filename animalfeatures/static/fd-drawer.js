@@ -193,7 +193,12 @@ class Drawer {
      * @param {NodeListOf<SVGPathElement>} userPaths A list of SVGPathElement objects
      */
     restorePaths(userPaths) {
-        this.clearSVG();
+        // remove the current paths without clearing the state, so that
+        // listeners only see a single change to the restored drawing
+        for (let p of this.#userPaths) {
+            p.remove();
+        }
+        this.#userPaths = [];
         for (let p of userPaths) {
             this.#SVGElement.appendChild(p);
             this.#userPaths.push(p);
@@ -322,6 +327,131 @@ class Drawer {
     }
 }
 
+/**
+ * A draft journal that keeps the latest drawing state in localStorage
+ * together with a sequence number, so that after a reconnect or reload
+ * only a state the server has not acknowledged yet needs to be sent again
+ */
+class DraftJournal {
+    #key;
+    #seq = 0;
+    #ackedSeq = 0;
+    #drawing = "";
+
+    /**
+     * @param {string} key The localStorage key to keep the draft under
+     */
+    constructor(key) {
+        this.#key = key;
+        this.#load();
+    }
+
+    /** @return {number} The sequence number of the latest recorded state */
+    get seq() {
+        return this.#seq;
+    }
+
+    /** @return {number} The last sequence number acknowledged by the server */
+    get ackedSeq() {
+        return this.#ackedSeq;
+    }
+
+    /** @return {string} The latest recorded (base64-encoded) drawing */
+    get drawing() {
+        return this.#drawing;
+    }
+
+    /**
+     * Whether there is a recorded state the server has not acknowledged
+     *
+     * @return {boolean}
+     */
+    hasPending() {
+        return this.#seq > this.#ackedSeq;
+    }
+
+    /**
+     * Records a new drawing state, unchanged states keep their sequence number
+     *
+     * @param {string} drawing The base64-encoded drawing
+     * @return {number} The sequence number of the recorded state
+     */
+    record(drawing) {
+        if (drawing !== this.#drawing) {
+            this.#seq += 1;
+            this.#drawing = drawing;
+            this.#persist();
+        }
+        return this.#seq;
+    }
+
+    /**
+     * Marks everything up to seq as stored on the server
+     *
+     * @param {number} seq The sequence number the server acknowledged
+     */
+    acknowledge(seq) {
+        this.#ackedSeq = Math.max(this.#ackedSeq, seq);
+        // never hand out a sequence number the server has already seen
+        this.#seq = Math.max(this.#seq, this.#ackedSeq);
+        this.#persist();
+    }
+
+    /**
+     * Replaces the journal with a state the server already has stored
+     *
+     * @param {number} seq The sequence number of the server state
+     * @param {string} drawing The base64-encoded drawing stored on the server
+     */
+    restore(seq, drawing) {
+        this.#seq = seq;
+        this.#ackedSeq = seq;
+        this.#drawing = drawing;
+        this.#persist();
+    }
+
+    /**
+     * Removes the draft, e.g. once the drawing is completed
+     *
+     * @return {void}
+     */
+    clear() {
+        this.#seq = 0;
+        this.#ackedSeq = 0;
+        this.#drawing = "";
+        try {
+            localStorage.removeItem(this.#key);
+        } catch (e) {
+            // storage unavailable, nothing to remove
+        }
+    }
+
+    #load() {
+        try {
+            const stored = JSON.parse(localStorage.getItem(this.#key));
+            if (stored) {
+                this.#seq = stored.seq || 0;
+                this.#ackedSeq = stored.ackedSeq || 0;
+                this.#drawing = stored.drawing || "";
+            }
+        } catch (e) {
+            // storage unavailable or corrupt, start from an empty journal
+        }
+    }
+
+    #persist() {
+        try {
+            localStorage.setItem(this.#key, JSON.stringify({
+                seq: this.#seq,
+                ackedSeq: this.#ackedSeq,
+                drawing: this.#drawing
+            }));
+        } catch (e) {
+            // storage unavailable or full, keep the journal in memory only
+        }
+    }
+}
+
 /**
  * Helper class with various static functions, e.g., export and download
  */